@@ -5,14 +5,15 @@
 
 from __future__ import absolute_import, division, print_function
 
-from typing import Any, Dict
+import dataclasses
+from typing import Any, Dict, Iterable, Optional
 
 __metaclass__ = type
 
 from ansible.module_utils.basic import AnsibleModule, env_fallback, missing_required_lib
 
 try:
-    from scaleway import Client
+    from scaleway import Client, WaitForOptions
 
     from scaleway_core.profile.env import (
         ENV_KEY_SCW_ACCESS_KEY,
@@ -67,6 +68,16 @@ def scaleway_waitable_resource_argument_spec() -> Dict[str, Dict[str, Any]]:
     )
 
 
+def scaleway_get_wait_options(
+    module: AnsibleModule,
+    max_delay: float = 15,
+) -> Optional["WaitForOptions"]:
+    if not module.params["wait"]:
+        return None
+
+    return WaitForOptions(timeout=module.params["wait_timeout"], max_delay=max_delay)
+
+
 def scaleway_get_client_from_module(module: AnsibleModule):
     if not HAS_SCALEWAY_SDK:
         module.fail_json(missing_required_lib("scaleway"))
@@ -140,3 +151,21 @@ def scaleway_pop_waitable_resource_params(module: AnsibleModule) -> None:
     for param in params:
         if param in module.params:
             module.params.pop(param)
+
+
+def scaleway_pop_unset_params(module: AnsibleModule, keys: Iterable[str]) -> None:
+    for key in keys:
+        if module.params.get(key) is None:
+            module.params.pop(key, None)
+
+
+def scaleway_resource_to_dict(
+    resource: Any,
+    fields: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    data = dataclasses.asdict(resource)
+
+    if fields is None:
+        return data
+
+    return {field: data.get(field) for field in fields}
@@ -192,7 +192,7 @@ from ansible_collections.scaleway.scaleway.plugins.module_utils.scaleway import
 )
 
 try:
-    from scaleway import Client, ScalewayException
+    from scaleway import ScalewayException
     from scaleway.rdb.v1 import RdbV1API
 
     HAS_SCALEWAY_SDK = True
@@ -200,9 +200,7 @@ except ImportError:
     HAS_SCALEWAY_SDK = False
 
 
-def create(module: AnsibleModule, client: "Client") -> None:
-    api = RdbV1API(client)
-
+def create(module: AnsibleModule, api: "RdbV1API") -> None:
     id = module.params.pop("id", None)
     if id is not None:
         resource = api.get_instance(instance_id=id)
@@ -226,9 +224,7 @@ def create(module: AnsibleModule, client: "Client") -> None:
     module.exit_json(changed=True, data=resource.__dict__)
 
 
-def delete(module: AnsibleModule, client: "Client") -> None:
-    api = RdbV1API(client)
-
+def delete(module: AnsibleModule, api: "RdbV1API") -> None:
     id = module.params.pop("id", None)
     name = module.params.pop("name", None)
 
@@ -264,15 +260,16 @@ def delete(module: AnsibleModule, client: "Client") -> None:
 
 def core(module: AnsibleModule) -> None:
     client = scaleway_get_client_from_module(module)
+    api = RdbV1API(client)
 
     state = module.params.pop("state")
     scaleway_pop_client_params(module)
     scaleway_pop_waitable_resource_params(module)
 
     if state == "present":
-        create(module, client)
+        create(module, api)
     elif state == "absent":
-        delete(module, client)
+        delete(module, api)
 
 
 def main() -> None:
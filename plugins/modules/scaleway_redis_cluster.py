@@ -34,26 +34,44 @@ options:
         description: cluster_id
         type: str
         required: false
+    cluster_ids:
+        description:
+            - List of cluster IDs to delete.
+            - The clusters are deleted concurrently.
+            - Only used when I(state=absent).
+        type: list
+        elements: str
+        required: false
     version:
-        description: version
+        description:
+            - version
+            - Required when I(state=present).
         type: str
-        required: true
+        required: false
     node_type:
-        description: node_type
+        description:
+            - node_type
+            - Required when I(state=present).
         type: str
-        required: true
+        required: false
     user_name:
-        description: user_name
+        description:
+            - user_name
+            - Required when I(state=present).
         type: str
-        required: true
+        required: false
     password:
-        description: password
+        description:
+            - password
+            - Required when I(state=present).
         type: str
-        required: true
+        required: false
     tls_enabled:
-        description: tls_enabled
+        description:
+            - tls_enabled
+            - Required when I(state=present).
         type: bool
-        required: true
+        required: false
     zone:
         description: zone
         type: str
@@ -102,6 +120,15 @@ EXAMPLES = r"""
     user_name: "aaaaaa"
     password: "aaaaaa"
     tls_enabled: true
+
+- name: Delete several clusters at once
+  scaleway.scaleway.scaleway_redis_cluster:
+    access_key: "{{ scw_access_key }}"
+    secret_key: "{{ scw_secret_key }}"
+    state: absent
+    cluster_ids:
+      - 11111111-1111-1111-1111-111111111111
+      - 22222222-2222-2222-2222-222222222222
 """
 
 RETURN = r"""
@@ -138,8 +165,28 @@ cluster:
         upgradable_versions:
             - aaaaaa
             - bbbbbb
+
+deleted:
+    description:
+        - IDs of the clusters deleted through I(cluster_ids).
+        - In check mode, the IDs of the clusters that would be deleted.
+    returned: when I(cluster_ids) is set
+    type: list
+    elements: str
+    sample:
+        - 11111111-1111-1111-1111-111111111111
+
+not_deleted:
+    description: IDs of the clusters from I(cluster_ids) that could not be deleted.
+    returned: when I(cluster_ids) is set
+    type: list
+    elements: str
+    sample: []
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
 from ansible.module_utils.basic import (
     AnsibleModule,
     missing_required_lib,
@@ -148,59 +195,249 @@ from ansible_collections.scaleway.scaleway.plugins.module_utils.scaleway import
     scaleway_argument_spec,
     scaleway_waitable_resource_argument_spec,
     scaleway_get_client_from_module,
+    scaleway_get_wait_options,
     scaleway_pop_client_params,
+    scaleway_pop_unset_params,
     scaleway_pop_waitable_resource_params,
+    scaleway_resource_to_dict,
 )
 
 try:
-    from scaleway import Client, ScalewayException
-    from scaleway.redis.v1 import RedisV1API
+    from scaleway import ScalewayException, WaitForOptions
+    from scaleway.redis.v1 import CLUSTER_TRANSIENT_STATUSES, RedisV1API
 
     HAS_SCALEWAY_SDK = True
 except ImportError:
     HAS_SCALEWAY_SDK = False
 
 
-def create(module: AnsibleModule, client: "Client") -> None:
-    api = RedisV1API(client)
+ARGUMENT_SPEC = {
+    **scaleway_argument_spec(),
+    **scaleway_waitable_resource_argument_spec(),
+    "state": dict(type="str", default="present", choices=["absent", "present"]),
+    "cluster_id": dict(type="str"),
+    "cluster_ids": dict(type="list", elements="str"),
+    "version": dict(
+        type="str",
+        required=False,
+    ),
+    "node_type": dict(
+        type="str",
+        required=False,
+    ),
+    "user_name": dict(
+        type="str",
+        required=False,
+    ),
+    "password": dict(
+        type="str",
+        required=False,
+        no_log=True,
+    ),
+    "tls_enabled": dict(
+        type="bool",
+        required=False,
+    ),
+    "zone": dict(
+        type="str",
+        required=False,
+    ),
+    "project_id": dict(
+        type="str",
+        required=False,
+    ),
+    "name": dict(
+        type="str",
+        required=False,
+    ),
+    "tags": dict(
+        type="list",
+        required=False,
+        elements="str",
+    ),
+    "cluster_size": dict(
+        type="int",
+        required=False,
+    ),
+    "acl_rules": dict(
+        type="list",
+        required=False,
+        elements="str",
+    ),
+    "endpoints": dict(
+        type="list",
+        required=False,
+        elements="str",
+    ),
+    "cluster_settings": dict(
+        type="list",
+        required=False,
+        elements="str",
+    ),
+}
+
+
+OPTIONAL_PARAMS = (
+    "zone",
+    "name",
+    "tags",
+    "cluster_size",
+    "acl_rules",
+    "endpoints",
+    "cluster_settings",
+)
+
+
+CLUSTER_FIELDS = (
+    "id",
+    "name",
+    "project_id",
+    "status",
+    "version",
+    "endpoints",
+    "tags",
+    "node_type",
+    "created_at",
+    "updated_at",
+    "tls_enabled",
+    "cluster_settings",
+    "acl_rules",
+    "cluster_size",
+    "zone",
+    "user_name",
+    "upgradable_versions",
+)
+
+
+def create(
+    module: AnsibleModule,
+    api: "RedisV1API",
+    wait_options: Optional["WaitForOptions"],
+) -> None:
+    resource_id = module.params.pop("cluster_id", None)
+    module.params.pop("cluster_ids", None)
 
-    id = module.params.pop("id", None)
-    if id is not None:
-        resource = api.get_cluster(cluster_id=id)
+    if resource_id is not None:
+        resource = api.get_cluster(cluster_id=resource_id, zone=module.params["zone"])
 
         if module.check_mode:
             module.exit_json(changed=False)
 
-        module.exit_json(changed=False, data=resource)
+        module.exit_json(
+            changed=False, data=scaleway_resource_to_dict(resource, CLUSTER_FIELDS)
+        )
 
     if module.check_mode:
         module.exit_json(changed=True)
 
-    not_none_params = {
-        key: value for key, value in module.params.items() if value is not None
-    }
-    resource = api.create_cluster(**not_none_params)
-    resource = api.wait_for_cluster(
-        cluster_id=resource.id, region=module.params["region"]
+    scaleway_pop_client_params(module)
+    scaleway_pop_waitable_resource_params(module)
+
+    scaleway_pop_unset_params(module, OPTIONAL_PARAMS)
+
+    resource = api.create_cluster(**module.params)
+
+    if wait_options is not None and resource.status in CLUSTER_TRANSIENT_STATUSES:
+        resource = api.wait_for_cluster(
+            cluster_id=resource.id, zone=resource.zone, options=wait_options
+        )
+
+    module.exit_json(
+        changed=True, data=scaleway_resource_to_dict(resource, CLUSTER_FIELDS)
     )
 
-    module.exit_json(changed=True, data=resource.__dict__)
 
+def wait_for_deletion(
+    api: "RedisV1API",
+    cluster_id: str,
+    zone: str,
+    wait_options: Optional["WaitForOptions"],
+) -> None:
+    if wait_options is None:
+        return
+
+    try:
+        api.wait_for_cluster(cluster_id=cluster_id, zone=zone, options=wait_options)
+    except ScalewayException as e:
+        if e.status_code != 404:
+            raise e
+
+
+def delete_many(
+    module: AnsibleModule,
+    api: "RedisV1API",
+    cluster_ids: List[str],
+    wait_options: Optional["WaitForOptions"],
+) -> None:
+    zone = module.params["zone"]
+
+    def delete_one(cluster_id: str) -> Tuple[str, bool, Optional[str]]:
+        try:
+            if module.check_mode:
+                api.get_cluster(cluster_id=cluster_id, zone=zone)
+            else:
+                resource = api.delete_cluster(cluster_id=cluster_id, zone=zone)
+                wait_for_deletion(api, resource.id, resource.zone, wait_options)
+        except ScalewayException as e:
+            if e.status_code == 404:
+                return cluster_id, False, None
+            return cluster_id, False, str(e)
+        except TimeoutError as e:
+            return cluster_id, False, str(e)
+
+        return cluster_id, True, None
+
+    with ThreadPoolExecutor(max_workers=min(len(cluster_ids), 8)) as executor:
+        results = list(executor.map(delete_one, cluster_ids))
+
+    deleted = [cluster_id for cluster_id, done, _ in results if done]
+    not_deleted = [cluster_id for cluster_id, _, error in results if error is not None]
+
+    if not_deleted:
+        errors = "; ".join(
+            f"{cluster_id}: {error}"
+            for cluster_id, _, error in results
+            if error is not None
+        )
+        module.fail_json(
+            msg=f"failed to delete redis's cluster(s): {errors}",
+            changed=bool(deleted),
+            deleted=deleted,
+            not_deleted=not_deleted,
+        )
+
+    module.exit_json(
+        changed=bool(deleted),
+        msg=f"{len(deleted)} redis's cluster(s) deleted",
+        deleted=deleted,
+        not_deleted=not_deleted,
+    )
 
-def delete(module: AnsibleModule, client: "Client") -> None:
-    api = RedisV1API(client)
 
-    id = module.params.pop("id", None)
-    name = module.params.pop("name", None)
+def delete(
+    module: AnsibleModule,
+    api: "RedisV1API",
+    wait_options: Optional["WaitForOptions"],
+) -> None:
+    cluster_ids = module.params.pop("cluster_ids", None)
+    if cluster_ids:
+        delete_many(module, api, cluster_ids, wait_options)
+
+    params = module.params
+    resource_id, name, zone = (
+        params.pop("cluster_id", None),
+        params.pop("name", None),
+        params.pop("zone", None),
+    )
 
-    if id is not None:
-        resource = api.get_cluster(cluster_id=id, region=module.params["region"])
+    if resource_id is not None:
+        resource = api.get_cluster(cluster_id=resource_id, zone=zone)
     elif name is not None:
-        resources = api.list_clusters_all(name=name, region=module.params["region"])
+        resources = api.list_clusters_all(name=name, zone=zone)
         if len(resources) == 0:
-            module.exit_json(msg="No cluster found with name {name}")
+            module.exit_json(msg=f"No cluster found with name {name}")
         elif len(resources) > 1:
-            module.exit_json(msg="More than one cluster found with name {name}")
+            module.exit_json(msg=f"More than one cluster found with name {name}")
         else:
             resource = resources[0]
     else:
@@ -209,13 +446,8 @@ def delete(module: AnsibleModule, client: "Client") -> None:
     if module.check_mode:
         module.exit_json(changed=True)
 
-    api.delete_cluster(cluster_id=resource.id, region=module.params["region"])
-
-    try:
-        api.wait_for_cluster(cluster_id=resource.id, region=module.params["region"])
-    except ScalewayException as e:
-        if e.status_code != 404:
-            raise e
+    api.delete_cluster(cluster_id=resource.id, zone=resource.zone)
+    wait_for_deletion(api, resource.id, resource.zone, wait_options)
 
     module.exit_json(
         changed=True,
@@ -223,87 +455,34 @@ def delete(module: AnsibleModule, client: "Client") -> None:
     )
 
 
+STATE_HANDLERS = {
+    "present": create,
+    "absent": delete,
+}
+
+
 def core(module: AnsibleModule) -> None:
     client = scaleway_get_client_from_module(module)
+    api = RedisV1API(client)
+    wait_options = scaleway_get_wait_options(module)
 
     state = module.params.pop("state")
-    scaleway_pop_client_params(module)
-    scaleway_pop_waitable_resource_params(module)
 
-    if state == "present":
-        create(module, client)
-    elif state == "absent":
-        delete(module, client)
+    STATE_HANDLERS[state](module, api, wait_options)
 
 
 def main() -> None:
-    argument_spec = scaleway_argument_spec()
-    argument_spec.update(scaleway_waitable_resource_argument_spec())
-    argument_spec.update(
-        state=dict(type="str", default="present", choices=["absent", "present"]),
-        cluster_id=dict(type="str"),
-        version=dict(
-            type="str",
-            required=True,
-        ),
-        node_type=dict(
-            type="str",
-            required=True,
-        ),
-        user_name=dict(
-            type="str",
-            required=True,
-        ),
-        password=dict(
-            type="str",
-            required=True,
-            no_log=True,
-        ),
-        tls_enabled=dict(
-            type="bool",
-            required=True,
-        ),
-        zone=dict(
-            type="str",
-            required=False,
-        ),
-        project_id=dict(
-            type="str",
-            required=False,
-        ),
-        name=dict(
-            type="str",
-            required=False,
-        ),
-        tags=dict(
-            type="list",
-            required=False,
-            elements="str",
-        ),
-        cluster_size=dict(
-            type="int",
-            required=False,
-        ),
-        acl_rules=dict(
-            type="list",
-            required=False,
-            elements="str",
-        ),
-        endpoints=dict(
-            type="list",
-            required=False,
-            elements="str",
-        ),
-        cluster_settings=dict(
-            type="list",
-            required=False,
-            elements="str",
-        ),
-    )
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
-        required_one_of=(["cluster_id", "name"],),
+        argument_spec=ARGUMENT_SPEC,
+        required_one_of=(["cluster_id", "name", "cluster_ids"],),
+        mutually_exclusive=(["cluster_id", "cluster_ids"], ["name", "cluster_ids"]),
+        required_if=(
+            [
+                "state",
+                "present",
+                ["version", "node_type", "user_name", "password", "tls_enabled"],
+            ],
+        ),
         supports_check_mode=True,
     )
 
@@ -37,7 +37,7 @@ options:
     name:
         description: name
         type: str
-        required: true
+        required: false
     region:
         description: region
         type: str
@@ -99,11 +99,12 @@ from ansible_collections.scaleway.scaleway.plugins.module_utils.scaleway import
     scaleway_waitable_resource_argument_spec,
     scaleway_get_client_from_module,
     scaleway_pop_client_params,
+    scaleway_pop_unset_params,
     scaleway_pop_waitable_resource_params,
+    scaleway_resource_to_dict,
 )
 
 try:
-    from scaleway import Client
     from scaleway.secret.v1alpha1 import SecretV1Alpha1API
 
     HAS_SCALEWAY_SDK = True
@@ -111,38 +112,94 @@ except ImportError:
     HAS_SCALEWAY_SDK = False
 
 
-def create(module: AnsibleModule, client: "Client") -> None:
-    api = SecretV1Alpha1API(client)
+ARGUMENT_SPEC = {
+    **scaleway_argument_spec(),
+    **scaleway_waitable_resource_argument_spec(),
+    "state": dict(type="str", default="present", choices=["absent", "present"]),
+    "secret_id": dict(type="str", no_log=True),
+    "name": dict(
+        type="str",
+        required=False,
+    ),
+    "region": dict(
+        type="str",
+        required=False,
+        choices=["fr-par", "nl-ams", "pl-waw"],
+    ),
+    "project_id": dict(
+        type="str",
+        required=False,
+    ),
+    "tags": dict(
+        type="list",
+        required=False,
+        elements="str",
+    ),
+    "description": dict(
+        type="str",
+        required=False,
+    ),
+}
+
+
+OPTIONAL_PARAMS = (
+    "region",
+    "tags",
+    "description",
+)
+
+
+SECRET_FIELDS = (
+    "id",
+    "project_id",
+    "name",
+    "status",
+    "created_at",
+    "updated_at",
+    "tags",
+    "region",
+    "version_count",
+    "description",
+)
 
-    id = module.params.pop("id", None)
-    if id is not None:
-        resource = api.get_secret(secret_id=id)
+
+def create(module: AnsibleModule, api: "SecretV1Alpha1API") -> None:
+    resource_id = module.params.pop("secret_id", None)
+    if resource_id is not None:
+        resource = api.get_secret(secret_id=resource_id, region=module.params["region"])
 
         if module.check_mode:
             module.exit_json(changed=False)
 
-        module.exit_json(changed=False, data=resource)
+        module.exit_json(
+            changed=False, data=scaleway_resource_to_dict(resource, SECRET_FIELDS)
+        )
 
     if module.check_mode:
         module.exit_json(changed=True)
 
-    not_none_params = {
-        key: value for key, value in module.params.items() if value is not None
-    }
-    resource = api.create_secret(**not_none_params)
+    scaleway_pop_client_params(module)
+    scaleway_pop_waitable_resource_params(module)
 
-    module.exit_json(changed=True, data=resource.__dict__)
+    scaleway_pop_unset_params(module, OPTIONAL_PARAMS)
 
+    resource = api.create_secret(**module.params)
+
+    module.exit_json(
+        changed=True, data=scaleway_resource_to_dict(resource, SECRET_FIELDS)
+    )
 
-def delete(module: AnsibleModule, client: "Client") -> None:
-    api = SecretV1Alpha1API(client)
 
-    id = module.params.pop("id", None)
-    name = module.params.pop("name", None)
-    region = module.params.pop("region", None)
+def delete(module: AnsibleModule, api: "SecretV1Alpha1API") -> None:
+    params = module.params
+    resource_id, name, region = (
+        params.pop("secret_id", None),
+        params.pop("name", None),
+        params.pop("region", None),
+    )
 
-    if id is not None:
-        resource = api.get_secret(secret_id=id, region=region)
+    if resource_id is not None:
+        resource = api.get_secret(secret_id=resource_id, region=region)
     elif name is not None:
         resource = api.get_secret_by_name(secret_name=name, region=region)
 
@@ -157,51 +214,24 @@ def delete(module: AnsibleModule, client: "Client") -> None:
     )
 
 
+STATE_HANDLERS = {
+    "present": create,
+    "absent": delete,
+}
+
+
 def core(module: AnsibleModule) -> None:
     client = scaleway_get_client_from_module(module)
+    api = SecretV1Alpha1API(client)
 
     state = module.params.pop("state")
-    scaleway_pop_client_params(module)
-    scaleway_pop_waitable_resource_params(module)
 
-    if state == "present":
-        create(module, client)
-    elif state == "absent":
-        delete(module, client)
+    STATE_HANDLERS[state](module, api)
 
 
 def main() -> None:
-    argument_spec = scaleway_argument_spec()
-    argument_spec.update(scaleway_waitable_resource_argument_spec())
-    argument_spec.update(
-        state=dict(type="str", default="present", choices=["absent", "present"]),
-        secret_id=dict(type="str", no_log=True),
-        name=dict(
-            type="str",
-            required=True,
-        ),
-        region=dict(
-            type="str",
-            required=False,
-            choices=["fr-par", "nl-ams", "pl-waw"],
-        ),
-        project_id=dict(
-            type="str",
-            required=False,
-        ),
-        tags=dict(
-            type="list",
-            required=False,
-            elements="str",
-        ),
-        description=dict(
-            type="str",
-            required=False,
-        ),
-    )
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=ARGUMENT_SPEC,
         required_one_of=(["secret_id", "name"],),
         supports_check_mode=True,
     )
@@ -40,7 +40,7 @@ options:
     name:
         description: secret's name
         type: str
-        required: true
+        required: false
     region:
         description: region
         type: str
@@ -58,15 +58,28 @@ options:
         type: bool
         required: false
     destroy_previous:
-        description: when creating a new version, destroy the previous version
+        description:
+            - when creating a new version, destroy the previous version
+            - Not supported by the API, setting it to C(true) fails the task.
+            - Use I(disable_previous) or I(state=absent) with I(revision) instead.
         type: bool
         required: false
     revision:
         description: revision
         type: str
         required: false
+    revisions:
+        description:
+            - List of revisions to delete.
+            - Only used when I(state=absent).
+        type: list
+        elements: str
+        required: false
     tags:
-        description: tags
+        description:
+            - tags
+            - Secret versions have no tags, this option is ignored with a warning.
+            - Use M(scaleway.scaleway.scaleway_secret) to tag the secret.
         type: list
         elements: str
         required: false
@@ -75,7 +88,9 @@ options:
         type: str
         required: false
     data:
-        description: the secret value
+        description:
+            - the secret value
+            - Required when I(state=present).
         type: str
         required: false
 """
@@ -100,6 +115,17 @@ EXAMPLES = r"""
     region: "{{ scw_region }}"
     name: "aaaaaa"
   register: data
+
+- name: Delete several versions of the secret
+  scaleway.scaleway.scaleway_secret_version:
+    access_key: "{{ scw_access_key }}"
+    secret_key: "{{ scw_secret_key }}"
+    region: "{{ scw_region }}"
+    name: "aaaaaa"
+    state: absent
+    revisions:
+      - "1"
+      - "2"
 """
 
 RETURN = r"""
@@ -128,9 +154,26 @@ secret_data:
     type: dict
     sample:
         data: "my_secret_data"
+
+revisions:
+    description: The deleted revisions
+    returned: when I(state=absent)
+    type: list
+    elements: str
+    sample:
+        - "1"
+        - "2"
+
+not_deleted:
+    description: The revisions that could not be deleted
+    returned: when I(state=absent)
+    type: list
+    elements: str
+    sample: []
 """
 
-import base64
+import binascii
+from typing import Callable, Optional
 
 from ansible.module_utils.basic import (
     AnsibleModule,
@@ -142,11 +185,11 @@ from ansible_collections.scaleway.scaleway.plugins.module_utils.scaleway import
     scaleway_get_client_from_module,
     scaleway_pop_client_params,
     scaleway_pop_waitable_resource_params,
+    scaleway_resource_to_dict,
 )
 
 try:
-    from scaleway import Client
-    from scaleway.secret.v1alpha1 import SecretV1Alpha1API
+    from scaleway.secret.v1alpha1 import Secret, SecretV1Alpha1API, SecretVersion
     from scaleway_core.api import ScalewayException
 
     HAS_SCALEWAY_SDK = True
@@ -154,228 +197,295 @@ except ImportError:
     HAS_SCALEWAY_SDK = False
 
 
-def create(module: AnsibleModule, client: "Client") -> None:
-    api = SecretV1Alpha1API(client)
-    region = module.params.pop("region", None)
-    project_id = module.params.pop("project_id", None)
-    name = module.params.pop("name", None)
-    id = module.params.pop("id", None)
+ARGUMENT_SPEC = {
+    **scaleway_argument_spec(),
+    **scaleway_waitable_resource_argument_spec(),
+    "state": dict(
+        type="str",
+        default="present",
+        choices=["absent", "present", "enable", "disable", "access"],
+    ),
+    "secret_id": dict(type="str", no_log=True),
+    "name": dict(
+        type="str",
+        required=False,
+    ),
+    "region": dict(
+        type="str",
+        required=False,
+        choices=["fr-par", "nl-ams", "pl-waw"],
+    ),
+    "project_id": dict(
+        type="str",
+        required=False,
+    ),
+    "tags": dict(
+        type="list",
+        required=False,
+        elements="str",
+    ),
+    "description": dict(
+        type="str",
+        required=False,
+    ),
+    "destroy_previous": dict(type="bool", required=False),
+    "disable_previous": dict(type="bool", required=False),
+    "data": dict(
+        type="str",
+        required=False,
+        #  no_log=True
+    ),
+    "revision": dict(
+        type="str",
+        required=False,
+    ),
+    "revisions": dict(type="list", elements="str"),
+}
+
+
+VERSION_PARAMS = (
+    "description",
+    "disable_previous",
+)
 
-    data = module.params.pop("data", None).encode()
-    if data is not None:
-        data = base64.b64encode(data).decode()
 
-    not_none_params = {
-        key: value for key, value in module.params.items() if value is not None
-    }
+SECRET_FIELDS = (
+    "id",
+    "project_id",
+    "name",
+    "status",
+    "created_at",
+    "updated_at",
+    "tags",
+    "region",
+    "version_count",
+    "description",
+)
+
+
+def resolve_secret(
+    api: "SecretV1Alpha1API",
+    resource_id: Optional[str],
+    name: Optional[str],
+    region: Optional[str],
+) -> "Secret":
+    if resource_id is not None:
+        return api.get_secret(secret_id=resource_id, region=region)
 
-    if id is not None:
-        secret = api.get_secret(secret_id=id)
-        secret_version = api.create_secret_version(
-            secret_id=id,
-            region=region,
-            data=data,
-            **not_none_params,
+    return api.get_secret_by_name(secret_name=name, region=region)
+
+
+def try_get_secret_by_name(
+    api: "SecretV1Alpha1API",
+    name: str,
+    region: Optional[str],
+) -> Optional["Secret"]:
+    try:
+        return api.get_secret_by_name(secret_name=name, region=region)
+    except ScalewayException as exc:
+        if exc.status_code == 404:
+            return None
+        raise exc
+
+
+def create(module: AnsibleModule, api: "SecretV1Alpha1API") -> None:
+    if module.params.pop("destroy_previous", None):
+        module.fail_json(
+            msg="destroy_previous is not supported, use disable_previous instead"
         )
 
-        if module.check_mode:
-            module.exit_json(changed=False)
+    if module.params.pop("tags", None) is not None:
+        module.warn("tags is ignored, secret versions cannot be tagged")
 
-        module.exit_json(changed=False, data=secret)
-    elif name is not None:
-        try:
-            secret = api.get_secret_by_name(secret_name=name, region=region)
-        except ScalewayException as exc:
-            if exc.status_code == 404:
+    if module.check_mode:
+        module.exit_json(changed=True)
+
+    params = module.params
+    resource_id, name, region, project_id = (
+        params.pop("secret_id", None),
+        params.pop("name", None),
+        params.pop("region", None),
+        params.pop("project_id", None),
+    )
+
+    data = params.pop("data").encode()
+    data = binascii.b2a_base64(data, newline=False).decode("ascii")
+
+    version_params = {
+        key: params[key] for key in VERSION_PARAMS if params.get(key) is not None
+    }
+
+    if resource_id is not None:
+        secret = api.get_secret(secret_id=resource_id, region=region)
+    else:
+        secret = try_get_secret_by_name(api, name, region)
+        if secret is None:
+            try:
                 secret = api.create_secret(
                     name=name, project_id=project_id, region=region
                 )
-            else:
-                raise exc
-        secret_version = api.create_secret_version(
-            secret_id=secret.id,
-            region=region,
-            data=data,
-            **not_none_params,
-        )
-    if module.check_mode:
-        module.exit_json(changed=True)
+            except ScalewayException as exc:
+                if exc.status_code != 409:
+                    raise exc
+                secret = api.get_secret_by_name(secret_name=name, region=region)
+
+    secret_version = api.create_secret_version(
+        secret_id=secret.id,
+        region=region,
+        data=data,
+        **version_params,
+    )
 
     module.exit_json(
         changed=True,
-        msg=f"secret {secret.name} ({secret.id}) revision { secret_version.revision }]\
-                           has been created",
-        data=secret.__dict__,
+        msg=f"secret {secret.name} ({secret.id}) revision {secret_version.revision} has been created",
+        data=scaleway_resource_to_dict(secret, SECRET_FIELDS),
     )
 
 
-def delete(module: AnsibleModule, client: "Client") -> None:
-    api = SecretV1Alpha1API(client)
-
-    id = module.params.pop("id", None)
-    name = module.params.pop("name", None)
-    region = module.params.pop("region", None)
-    revision = module.params.pop("revision", None)
+def delete(module: AnsibleModule, api: "SecretV1Alpha1API") -> None:
+    params = module.params
+    resource_id, name, region, revision, revisions = (
+        params.pop("secret_id", None),
+        params.pop("name", None),
+        params.pop("region", None),
+        params.pop("revision", None),
+        params.pop("revisions", None),
+    )
+    if revisions is None:
+        revisions = [revision]
+    elif not revisions:
+        module.exit_json(changed=False, revisions=[], not_deleted=[])
 
-    if id is not None:
-        secret = api.get_secret(secret_id=id, region=region)
-    elif name is not None:
-        secret = api.get_secret_by_name(secret_name=name, region=region)
-    else:
-        module.fail_json(msg="id is required")
+    secret = resolve_secret(api, resource_id, name, region)
 
     if module.check_mode:
         module.exit_json(changed=True)
 
-    api.destroy_secret_version(secret_id=secret.id, region=region, revision=revision)
+    deleted, not_deleted, errors = [], [], []
+    for revision in revisions:
+        try:
+            api.destroy_secret_version(
+                secret_id=secret.id, region=region, revision=revision
+            )
+        except ScalewayException as exc:
+            if exc.status_code == 404:
+                continue
+            not_deleted.append(revision)
+            errors.append(f"{revision}: {exc}")
+        else:
+            deleted.append(revision)
+
+    if not_deleted:
+        module.fail_json(
+            msg=f"secret's {secret.name} ({secret.id}) revision(s) could not be deleted: {'; '.join(errors)}",
+            changed=bool(deleted),
+            revisions=deleted,
+            not_deleted=not_deleted,
+        )
+
+    if not deleted:
+        module.exit_json(changed=False, revisions=[], not_deleted=[])
 
     module.exit_json(
         changed=True,
-        msg=f"secret's  {secret.name} ({secret.id}) revision{ revision } has been deleted",
+        msg=f"secret's {secret.name} ({secret.id}) revision {', '.join(deleted)} has been deleted",
+        revisions=deleted,
+        not_deleted=not_deleted,
     )
 
 
-def access(module: AnsibleModule, client: "Client") -> None:
-    api = SecretV1Alpha1API(client)
+def access(module: AnsibleModule, api: "SecretV1Alpha1API") -> None:
+    params = module.params
+    resource_id, name, region, revision = (
+        params.pop("secret_id", None),
+        params.pop("name", None),
+        params.pop("region", None),
+        params.pop("revision", None),
+    )
+    revision = "latest_enabled" if revision is None else revision
 
-    id = module.params.pop("id", None)
-    name = module.params.pop("name", None)
-    region = module.params.pop("region", None)
-    revision = module.params.pop("revision", None)
-    if id is not None:
-        secret = api.get_secret(secret_id=id, region=region)
+    if module.check_mode:
+        module.exit_json(changed=True)
 
-        if module.check_mode:
-            module.exit_json(changed=False)
+    if resource_id is not None:
+        secret_version = api.access_secret_version(
+            secret_id=resource_id, revision=revision, region=region
+        )
     else:
-        secret = api.get_secret_by_name(secret_name=name, region=region)
+        secret_version = api.access_secret_version_by_name(
+            secret_name=name, revision=revision, region=region
+        )
 
-    revision = "latest_enabled" if revision is None else revision
-    secret_version = api.access_secret_version(
-        secret_id=secret.id, revision=revision, region=region
-    )
-    data = base64.b64decode(secret_version.data)
-    if module.check_mode:
-        module.exit_json(changed=True)
+    data = binascii.a2b_base64(secret_version.data)
     module.exit_json(changed=True, data=data)
 
 
-def enable(module: AnsibleModule, client: "Client") -> None:
-    api = SecretV1Alpha1API(client)
-    region = module.params.pop("region", None)
-    project_id = module.params.pop("project_id", None)
-    name = module.params.pop("name", None)
-    id = module.params.pop("id", None)
-    revision = module.params.pop("revision", None)
-
-    if id is not None:
-        secret = api.get_secret(secret_id=id)
-    elif name is not None:
-        secret = api.get_secret_by_name(secret_name=name, region=region)
-    api.enable_secret_version(secret_id=secret.id, region=region, revision=revision)
+def set_version_status(
+    module: AnsibleModule,
+    api: "SecretV1Alpha1API",
+    action: Callable[..., "SecretVersion"],
+    status: str,
+) -> None:
+    params = module.params
+    resource_id, name, region, revision = (
+        params.pop("secret_id", None),
+        params.pop("name", None),
+        params.pop("region", None),
+        params.pop("revision", None),
+    )
+
+    secret = resolve_secret(api, resource_id, name, region)
+
     if module.check_mode:
         module.exit_json(changed=True)
 
+    action(secret_id=secret.id, region=region, revision=revision)
+
     module.exit_json(
         changed=True,
-        msg=f"secret's secret {secret.name} ({secret.id}) revision {revision } has been disabled",
-        data=secret.__dict__,
+        msg=f"secret's secret {secret.name} ({secret.id}) revision {revision} has been {status}",
+        data=scaleway_resource_to_dict(secret, SECRET_FIELDS),
     )
 
 
-def disable(module: AnsibleModule, client: "Client") -> None:
-    api = SecretV1Alpha1API(client)
+def enable(module: AnsibleModule, api: "SecretV1Alpha1API") -> None:
+    set_version_status(module, api, api.enable_secret_version, "enabled")
 
-    id = module.params.pop("id", None)
-    name = module.params.pop("name", None)
-    region = module.params.pop("region", None)
-    revision = module.params.pop("revision", None)
 
-    if id is not None:
-        secret = api.get_secret(secret_id=id, region=region)
-    elif name is not None:
-        secret = api.get_secret_by_name(secret_name=name, region=region)
-    else:
-        module.fail_json(msg="id is required")
+def disable(module: AnsibleModule, api: "SecretV1Alpha1API") -> None:
+    set_version_status(module, api, api.disable_secret_version, "disabled")
 
-    if module.check_mode:
-        module.exit_json(changed=True)
 
-    api.disable_secret_version(secret_id=secret.id, region=region, revision=revision)
-
-    module.exit_json(
-        changed=True,
-        msg=f"secret's secret {secret.name} ({secret.id}) revision { revision } has been disabled",
-    )
+STATE_HANDLERS = {
+    "present": create,
+    "absent": delete,
+    "enable": enable,
+    "disable": disable,
+    "access": access,
+}
 
 
 def core(module: AnsibleModule) -> None:
     client = scaleway_get_client_from_module(module)
+    api = SecretV1Alpha1API(client)
 
     state = module.params.pop("state")
     scaleway_pop_client_params(module)
     scaleway_pop_waitable_resource_params(module)
 
-    if state == "present":
-        create(module, client)
-    elif state == "absent":
-        delete(module, client)
-    elif state == "enable":
-        enable(module, client)
-    elif state == "disable":
-        disable(module, client)
-    elif state == "access":
-        access(module, client)
+    STATE_HANDLERS[state](module, api)
 
 
 def main() -> None:
-    argument_spec = scaleway_argument_spec()
-    argument_spec.update(scaleway_waitable_resource_argument_spec())
-    argument_spec.update(
-        state=dict(
-            type="str",
-            default="present",
-            choices=["absent", "present", "enable", "disable", "access"],
-        ),
-        secret_id=dict(type="str", no_log=True),
-        name=dict(
-            type="str",
-            required=True,
-        ),
-        region=dict(
-            type="str",
-            required=False,
-            choices=["fr-par", "nl-ams", "pl-waw"],
-        ),
-        project_id=dict(
-            type="str",
-            required=False,
-        ),
-        tags=dict(
-            type="list",
-            required=False,
-            elements="str",
-        ),
-        description=dict(
-            type="str",
-            required=False,
-        ),
-        destroy_previous=dict(type="bool", required=False),
-        disable_previous=dict(type="bool", required=False),
-        data=dict(
-            type="str",
-            required=False,
-            #  no_log=True
-        ),
-        revision=dict(
-            type="str",
-            required=False,
-        ),
-    )
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=ARGUMENT_SPEC,
         required_one_of=(["secret_id", "name"],),
+        mutually_exclusive=(["revision", "revisions"],),
+        required_if=(
+            ["state", "present", ["data"]],
+            ["state", "absent", ["revision", "revisions"], True],
+        ),
         supports_check_mode=True,
     )
 
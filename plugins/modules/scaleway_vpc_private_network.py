@@ -96,11 +96,12 @@ from ansible_collections.scaleway.scaleway.plugins.module_utils.scaleway import
     scaleway_waitable_resource_argument_spec,
     scaleway_get_client_from_module,
     scaleway_pop_client_params,
+    scaleway_pop_unset_params,
     scaleway_pop_waitable_resource_params,
+    scaleway_resource_to_dict,
 )
 
 try:
-    from scaleway import Client
     from scaleway.vpc.v1 import VpcV1API
 
     HAS_SCALEWAY_SDK = True
@@ -108,110 +109,134 @@ except ImportError:
     HAS_SCALEWAY_SDK = False
 
 
-def create(module: AnsibleModule, client: "Client") -> None:
-    api = VpcV1API(client)
+ARGUMENT_SPEC = {
+    **scaleway_argument_spec(),
+    **scaleway_waitable_resource_argument_spec(),
+    "state": dict(type="str", default="present", choices=["absent", "present"]),
+    "private_network_id": dict(type="str"),
+    "zone": dict(
+        type="str",
+        required=False,
+    ),
+    "name": dict(
+        type="str",
+        required=False,
+    ),
+    "project_id": dict(
+        type="str",
+        required=False,
+    ),
+    "tags": dict(
+        type="list",
+        required=False,
+        elements="str",
+    ),
+    "subnets": dict(
+        type="list",
+        required=False,
+        elements="str",
+    ),
+}
+
+
+OPTIONAL_PARAMS = (
+    "zone",
+    "name",
+    "tags",
+    "subnets",
+)
+
+
+PRIVATE_NETWORK_FIELDS = (
+    "id",
+    "name",
+    "organization_id",
+    "project_id",
+    "zone",
+    "tags",
+    "created_at",
+    "updated_at",
+    "subnets",
+)
 
-    id = module.params.pop("id", None)
-    if id is not None:
-        resource = api.get_private_network(private_network_id=id)
+
+def create(module: AnsibleModule, api: "VpcV1API") -> None:
+    resource_id = module.params.pop("private_network_id", None)
+    if resource_id is not None:
+        resource = api.get_private_network(
+            private_network_id=resource_id, zone=module.params["zone"]
+        )
 
         if module.check_mode:
             module.exit_json(changed=False)
 
-        module.exit_json(changed=False, data=resource)
+        module.exit_json(
+            changed=False,
+            data=scaleway_resource_to_dict(resource, PRIVATE_NETWORK_FIELDS),
+        )
 
     if module.check_mode:
         module.exit_json(changed=True)
 
-    not_none_params = {
-        key: value for key, value in module.params.items() if value is not None
-    }
-    resource = api.create_private_network(**not_none_params)
+    scaleway_pop_unset_params(module, OPTIONAL_PARAMS)
 
-    module.exit_json(changed=True, data=resource.__dict__)
+    resource = api.create_private_network(**module.params)
 
+    module.exit_json(
+        changed=True, data=scaleway_resource_to_dict(resource, PRIVATE_NETWORK_FIELDS)
+    )
 
-def delete(module: AnsibleModule, client: "Client") -> None:
-    api = VpcV1API(client)
 
-    id = module.params.pop("id", None)
+def delete(module: AnsibleModule, api: "VpcV1API") -> None:
+    resource_id = module.params.pop("private_network_id", None)
     name = module.params.pop("name", None)
+    zone = module.params["zone"]
 
-    if id is not None:
-        resource = api.get_private_network(
-            private_network_id=id, region=module.params["region"]
-        )
-    elif name is not None:
-        resources = api.list_private_networks_all(
-            name=name, region=module.params["region"]
-        )
+    if resource_id is None:
+        resources = api.list_private_networks(
+            name=name, zone=zone, page=1, page_size=2
+        ).private_networks
         if len(resources) == 0:
-            module.exit_json(msg="No private_network found with name {name}")
+            module.exit_json(msg=f"No private_network found with name {name}")
         elif len(resources) > 1:
-            module.exit_json(msg="More than one private_network found with name {name}")
-        else:
-            resource = resources[0]
-    else:
-        module.fail_json(msg="id is required")
+            module.exit_json(
+                msg=f"More than one private_network found with name {name}"
+            )
+        resource_id = resources[0].id
+    elif module.check_mode:
+        api.get_private_network(private_network_id=resource_id, zone=zone)
 
     if module.check_mode:
         module.exit_json(changed=True)
 
-    api.delete_private_network(
-        private_network_id=resource.id, region=module.params["region"]
-    )
+    api.delete_private_network(private_network_id=resource_id, zone=zone)
 
     module.exit_json(
         changed=True,
-        msg=f"vpc's private_network {resource.name} ({resource.id}) deleted",
+        msg=f"vpc's private_network {resource_id} deleted",
     )
 
 
+STATE_HANDLERS = {
+    "present": create,
+    "absent": delete,
+}
+
+
 def core(module: AnsibleModule) -> None:
     client = scaleway_get_client_from_module(module)
+    api = VpcV1API(client)
 
     state = module.params.pop("state")
     scaleway_pop_client_params(module)
     scaleway_pop_waitable_resource_params(module)
 
-    if state == "present":
-        create(module, client)
-    elif state == "absent":
-        delete(module, client)
+    STATE_HANDLERS[state](module, api)
 
 
 def main() -> None:
-    argument_spec = scaleway_argument_spec()
-    argument_spec.update(scaleway_waitable_resource_argument_spec())
-    argument_spec.update(
-        state=dict(type="str", default="present", choices=["absent", "present"]),
-        private_network_id=dict(type="str"),
-        zone=dict(
-            type="str",
-            required=False,
-        ),
-        name=dict(
-            type="str",
-            required=False,
-        ),
-        project_id=dict(
-            type="str",
-            required=False,
-        ),
-        tags=dict(
-            type="list",
-            required=False,
-            elements="str",
-        ),
-        subnets=dict(
-            type="list",
-            required=False,
-            elements="str",
-        ),
-    )
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=ARGUMENT_SPEC,
         required_one_of=(["private_network_id", "name"],),
         supports_check_mode=True,
     )
@@ -145,11 +145,12 @@ from ansible_collections.scaleway.scaleway.plugins.module_utils.scaleway import
     scaleway_waitable_resource_argument_spec,
     scaleway_get_client_from_module,
     scaleway_pop_client_params,
+    scaleway_pop_unset_params,
     scaleway_pop_waitable_resource_params,
+    scaleway_resource_to_dict,
 )
 
 try:
-    from scaleway import Client
     from scaleway.vpcgw.v1 import VpcgwV1API
 
     HAS_SCALEWAY_SDK = True
@@ -157,135 +158,176 @@ except ImportError:
     HAS_SCALEWAY_SDK = False
 
 
-def create(module: AnsibleModule, client: "Client") -> None:
-    api = VpcgwV1API(client)
+ARGUMENT_SPEC = {
+    **scaleway_argument_spec(),
+    **scaleway_waitable_resource_argument_spec(),
+    "state": dict(type="str", default="present", choices=["absent", "present"]),
+    "dhcp_id": dict(type="str"),
+    "subnet": dict(
+        type="str",
+        required=True,
+    ),
+    "zone": dict(
+        type="str",
+        required=False,
+    ),
+    "project_id": dict(
+        type="str",
+        required=False,
+    ),
+    "address": dict(
+        type="str",
+        required=False,
+    ),
+    "pool_low": dict(
+        type="str",
+        required=False,
+    ),
+    "pool_high": dict(
+        type="str",
+        required=False,
+    ),
+    "enable_dynamic": dict(
+        type="bool",
+        required=False,
+    ),
+    "valid_lifetime": dict(
+        type="str",
+        required=False,
+    ),
+    "renew_timer": dict(
+        type="str",
+        required=False,
+    ),
+    "rebind_timer": dict(
+        type="str",
+        required=False,
+    ),
+    "push_default_route": dict(
+        type="bool",
+        required=False,
+    ),
+    "push_dns_server": dict(
+        type="bool",
+        required=False,
+    ),
+    "dns_servers_override": dict(
+        type="list",
+        required=False,
+        elements="str",
+    ),
+    "dns_search": dict(
+        type="list",
+        required=False,
+        elements="str",
+    ),
+    "dns_local_name": dict(
+        type="str",
+        required=False,
+    ),
+}
+
+
+OPTIONAL_PARAMS = (
+    "zone",
+    "address",
+    "pool_low",
+    "pool_high",
+    "enable_dynamic",
+    "valid_lifetime",
+    "renew_timer",
+    "rebind_timer",
+    "push_default_route",
+    "push_dns_server",
+    "dns_servers_override",
+    "dns_search",
+    "dns_local_name",
+)
+
+
+DHCP_FIELDS = (
+    "id",
+    "organization_id",
+    "project_id",
+    "created_at",
+    "updated_at",
+    "subnet",
+    "address",
+    "pool_low",
+    "pool_high",
+    "enable_dynamic",
+    "valid_lifetime",
+    "renew_timer",
+    "rebind_timer",
+    "push_default_route",
+    "push_dns_server",
+    "dns_servers_override",
+    "dns_search",
+    "dns_local_name",
+    "zone",
+)
+
 
-    id = module.params.pop("id", None)
-    if id is not None:
-        resource = api.get_dhcp(dhcp_id=id)
+def create(module: AnsibleModule, api: "VpcgwV1API") -> None:
+    resource_id = module.params.pop("dhcp_id", None)
+    if resource_id is not None:
+        resource = api.get_dhcp(dhcp_id=resource_id, zone=module.params["zone"])
 
         if module.check_mode:
             module.exit_json(changed=False)
 
-        module.exit_json(changed=False, data=resource)
+        module.exit_json(
+            changed=False, data=scaleway_resource_to_dict(resource, DHCP_FIELDS)
+        )
 
     if module.check_mode:
         module.exit_json(changed=True)
 
-    not_none_params = {
-        key: value for key, value in module.params.items() if value is not None
-    }
-    resource = api.create_dhcp(**not_none_params)
+    scaleway_pop_unset_params(module, OPTIONAL_PARAMS)
 
-    module.exit_json(changed=True, data=resource.__dict__)
+    resource = api.create_dhcp(**module.params)
 
+    module.exit_json(
+        changed=True, data=scaleway_resource_to_dict(resource, DHCP_FIELDS)
+    )
 
-def delete(module: AnsibleModule, client: "Client") -> None:
-    api = VpcgwV1API(client)
 
-    id = module.params.pop("id", None)
+def delete(module: AnsibleModule, api: "VpcgwV1API") -> None:
+    resource_id = module.params.pop("dhcp_id", None)
+    zone = module.params["zone"]
 
-    if id is not None:
-        resource = api.get_dhcp(dhcp_id=id, region=module.params["region"])
-    else:
-        module.fail_json(msg="id is required")
+    if resource_id is None:
+        module.fail_json(msg="dhcp_id is required")
 
     if module.check_mode:
+        api.get_dhcp(dhcp_id=resource_id, zone=zone)
         module.exit_json(changed=True)
 
-    api.delete_dhcp(dhcp_id=resource.id, region=module.params["region"])
+    api.delete_dhcp(dhcp_id=resource_id, zone=zone)
 
     module.exit_json(
         changed=True,
-        msg=f"vpcgw's dhcp {resource.id} deleted",
+        msg=f"vpcgw's dhcp {resource_id} deleted",
     )
 
 
 def core(module: AnsibleModule) -> None:
     client = scaleway_get_client_from_module(module)
+    api = VpcgwV1API(client)
 
     state = module.params.pop("state")
     scaleway_pop_client_params(module)
     scaleway_pop_waitable_resource_params(module)
 
     if state == "present":
-        create(module, client)
+        create(module, api)
     elif state == "absent":
-        delete(module, client)
+        delete(module, api)
 
 
 def main() -> None:
-    argument_spec = scaleway_argument_spec()
-    argument_spec.update(scaleway_waitable_resource_argument_spec())
-    argument_spec.update(
-        state=dict(type="str", default="present", choices=["absent", "present"]),
-        dhcp_id=dict(type="str"),
-        subnet=dict(
-            type="str",
-            required=True,
-        ),
-        zone=dict(
-            type="str",
-            required=False,
-        ),
-        project_id=dict(
-            type="str",
-            required=False,
-        ),
-        address=dict(
-            type="str",
-            required=False,
-        ),
-        pool_low=dict(
-            type="str",
-            required=False,
-        ),
-        pool_high=dict(
-            type="str",
-            required=False,
-        ),
-        enable_dynamic=dict(
-            type="bool",
-            required=False,
-        ),
-        valid_lifetime=dict(
-            type="str",
-            required=False,
-        ),
-        renew_timer=dict(
-            type="str",
-            required=False,
-        ),
-        rebind_timer=dict(
-            type="str",
-            required=False,
-        ),
-        push_default_route=dict(
-            type="bool",
-            required=False,
-        ),
-        push_dns_server=dict(
-            type="bool",
-            required=False,
-        ),
-        dns_servers_override=dict(
-            type="list",
-            required=False,
-            elements="str",
-        ),
-        dns_search=dict(
-            type="list",
-            required=False,
-            elements="str",
-        ),
-        dns_local_name=dict(
-            type="str",
-            required=False,
-        ),
-    )
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=ARGUMENT_SPEC,
         supports_check_mode=True,
     )
 
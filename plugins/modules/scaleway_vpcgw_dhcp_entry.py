@@ -89,11 +89,12 @@ from ansible_collections.scaleway.scaleway.plugins.module_utils.scaleway import
     scaleway_waitable_resource_argument_spec,
     scaleway_get_client_from_module,
     scaleway_pop_client_params,
+    scaleway_pop_unset_params,
     scaleway_pop_waitable_resource_params,
+    scaleway_resource_to_dict,
 )
 
 try:
-    from scaleway import Client
     from scaleway.vpcgw.v1 import VpcgwV1API
 
     HAS_SCALEWAY_SDK = True
@@ -101,89 +102,108 @@ except ImportError:
     HAS_SCALEWAY_SDK = False
 
 
-def create(module: AnsibleModule, client: "Client") -> None:
-    api = VpcgwV1API(client)
+ARGUMENT_SPEC = {
+    **scaleway_argument_spec(),
+    **scaleway_waitable_resource_argument_spec(),
+    "state": dict(type="str", default="present", choices=["absent", "present"]),
+    "dhcp_entry_id": dict(type="str"),
+    "gateway_network_id": dict(
+        type="str",
+        required=True,
+    ),
+    "mac_address": dict(
+        type="str",
+        required=True,
+    ),
+    "ip_address": dict(
+        type="str",
+        required=True,
+    ),
+    "zone": dict(
+        type="str",
+        required=False,
+    ),
+}
+
+
+OPTIONAL_PARAMS = ("zone",)
+
+
+DHCP_ENTRY_FIELDS = (
+    "id",
+    "created_at",
+    "updated_at",
+    "gateway_network_id",
+    "mac_address",
+    "ip_address",
+    "hostname",
+    "type_",
+    "zone",
+)
+
 
-    id = module.params.pop("id", None)
-    if id is not None:
-        resource = api.get_dhcp_entry(dhcp_entry_id=id)
+def create(module: AnsibleModule, api: "VpcgwV1API") -> None:
+    resource_id = module.params.pop("dhcp_entry_id", None)
+    if resource_id is not None:
+        resource = api.get_dhcp_entry(
+            dhcp_entry_id=resource_id, zone=module.params["zone"]
+        )
 
         if module.check_mode:
             module.exit_json(changed=False)
 
-        module.exit_json(changed=False, data=resource)
+        module.exit_json(
+            changed=False, data=scaleway_resource_to_dict(resource, DHCP_ENTRY_FIELDS)
+        )
 
     if module.check_mode:
         module.exit_json(changed=True)
 
-    not_none_params = {
-        key: value for key, value in module.params.items() if value is not None
-    }
-    resource = api.create_dhcp_entry(**not_none_params)
+    scaleway_pop_unset_params(module, OPTIONAL_PARAMS)
 
-    module.exit_json(changed=True, data=resource.__dict__)
+    resource = api.create_dhcp_entry(**module.params)
 
+    module.exit_json(
+        changed=True, data=scaleway_resource_to_dict(resource, DHCP_ENTRY_FIELDS)
+    )
 
-def delete(module: AnsibleModule, client: "Client") -> None:
-    api = VpcgwV1API(client)
 
-    id = module.params.pop("id", None)
+def delete(module: AnsibleModule, api: "VpcgwV1API") -> None:
+    resource_id = module.params.pop("dhcp_entry_id", None)
+    zone = module.params["zone"]
 
-    if id is not None:
-        resource = api.get_dhcp_entry(dhcp_entry_id=id, region=module.params["region"])
-    else:
-        module.fail_json(msg="id is required")
+    if resource_id is None:
+        module.fail_json(msg="dhcp_entry_id is required")
 
     if module.check_mode:
+        api.get_dhcp_entry(dhcp_entry_id=resource_id, zone=zone)
         module.exit_json(changed=True)
 
-    api.delete_dhcp_entry(dhcp_entry_id=resource.id, region=module.params["region"])
+    api.delete_dhcp_entry(dhcp_entry_id=resource_id, zone=zone)
 
     module.exit_json(
         changed=True,
-        msg=f"vpcgw's dhcp_entry {resource.id} deleted",
+        msg=f"vpcgw's dhcp_entry {resource_id} deleted",
     )
 
 
 def core(module: AnsibleModule) -> None:
     client = scaleway_get_client_from_module(module)
+    api = VpcgwV1API(client)
 
     state = module.params.pop("state")
     scaleway_pop_client_params(module)
     scaleway_pop_waitable_resource_params(module)
 
     if state == "present":
-        create(module, client)
+        create(module, api)
     elif state == "absent":
-        delete(module, client)
+        delete(module, api)
 
 
 def main() -> None:
-    argument_spec = scaleway_argument_spec()
-    argument_spec.update(scaleway_waitable_resource_argument_spec())
-    argument_spec.update(
-        state=dict(type="str", default="present", choices=["absent", "present"]),
-        dhcp_entry_id=dict(type="str"),
-        gateway_network_id=dict(
-            type="str",
-            required=True,
-        ),
-        mac_address=dict(
-            type="str",
-            required=True,
-        ),
-        ip_address=dict(
-            type="str",
-            required=True,
-        ),
-        zone=dict(
-            type="str",
-            required=False,
-        ),
-    )
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=ARGUMENT_SPEC,
         supports_check_mode=True,
     )
 